@@ -28,6 +28,9 @@ PRODUCT_IMAGES = {
     "custom-live-edge-tables": "https://sawdustandcoffee.com/wp-content/uploads/sites/2/2023/07/PXL_20230325_210230630-scaled.jpg",
 }
 
+# Fields needed from the product listing - keeps catalog responses small
+PRODUCT_FIELDS = "id,slug,name"
+
 session = requests.Session()
 
 def login():
@@ -55,7 +58,10 @@ def login():
 def get_products():
     """Get all products from API"""
     print("\nFetching products...")
-    response = session.get(f"{API_URL}/public/products")
+    response = session.get(
+        f"{API_URL}/public/products",
+        params={"fields": PRODUCT_FIELDS}
+    )
 
     if response.status_code == 200:
         data = response.json()
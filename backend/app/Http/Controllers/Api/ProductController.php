@@ -8,6 +8,8 @@
 use App\Models\Product;
 use App\Models\ProductImage;
 use App\Models\StockNotification;
+use Illuminate\Database\Eloquent\Builder;
+use Illuminate\Database\Eloquent\Collection;
 use Illuminate\Http\JsonResponse;
 use Illuminate\Http\Request;
 use Illuminate\Support\Facades\Mail;
@@ -16,12 +18,31 @@
 
 class ProductController extends Controller
 {
+    /**
+     * Product columns a client may request through the `fields` parameter.
+     */
+    protected const SPARSE_COLUMNS = [
+        'id', 'name', 'slug', 'sku', 'description', 'long_description',
+        'price', 'sale_price', 'inventory', 'active', 'featured', 'badges',
+        'specifications', 'care_instructions', 'created_at', 'updated_at',
+    ];
+
+    /**
+     * Appended attributes a client may request, with the columns each one needs.
+     */
+    protected const SPARSE_APPENDS = [
+        'effective_price' => ['price', 'sale_price'],
+        'is_on_sale' => ['price', 'sale_price'],
+        'is_in_stock' => ['inventory'],
+    ];
+
     /**
      * Display a listing of products (Admin).
      */
     public function index(Request $request): JsonResponse
     {
-        $query = Product::with(['categories', 'images', 'variants', 'options.values']);
+        $query = Product::query();
+        $fields = $this->applySparseFields($query, $request, ['categories', 'images', 'variants', 'options.values']);
 
         // Search
         if ($request->has('search')) {
@@ -55,6 +76,7 @@ public function index(Request $request): JsonResponse
         $query->orderBy($sortBy, $sortOrder);
 
         $products = $query->paginate($request->get('per_page', 15));
+        $this->restrictToSparseFields($products->getCollection(), $fields);
 
         return response()->json($products);
     }
@@ -193,8 +215,8 @@ public function destroy(string $id): JsonResponse
      */
     public function publicIndex(Request $request): JsonResponse
     {
-        $query = Product::with(['categories', 'primaryImage'])
-            ->where('active', true);
+        $query = Product::where('active', true);
+        $fields = $this->applySparseFields($query, $request, ['categories', 'primaryImage']);
 
         // Filter by category
         if ($request->has('category')) {
@@ -269,10 +291,75 @@ public function publicIndex(Request $request): JsonResponse
         $query->orderBy($sortOrder[0], $sortOrder[1]);
 
         $products = $query->paginate($request->get('per_page', 12));
+        $this->restrictToSparseFields($products->getCollection(), $fields);
 
         return response()->json($products);
     }
 
+    /**
+     * Limit a product listing query to the comma-separated `fields` parameter.
+     *
+     * Without the parameter the full listing is returned with all given
+     * relations eager loaded. Otherwise only the requested columns are
+     * selected and only the requested relations are loaded. Returns the
+     * requested field names, or null when no sparse fieldset was asked for.
+     */
+    protected function applySparseFields(Builder $query, Request $request, array $relations): ?array
+    {
+        if (!is_string($request->input('fields')) || !$request->filled('fields')) {
+            $query->with($relations);
+
+            return null;
+        }
+
+        $requested = array_filter(array_map('trim', explode(',', $request->input('fields'))));
+
+        // Relations are serialized in snake_case, so accept those names and map them back
+        $relationNames = array_map(fn ($relation) => Str::snake(Str::before($relation, '.')), $relations);
+
+        $fields = array_map(
+            fn ($field) => in_array($field, $relationNames, true) ? Str::camel($field) : $field,
+            array_values(array_intersect(
+                $requested,
+                array_merge(self::SPARSE_COLUMNS, array_keys(self::SPARSE_APPENDS), $relationNames)
+            ))
+        );
+
+        // The primary key is always needed to identify rows and load relations
+        $columns = ['id'];
+        foreach ($fields as $field) {
+            if (in_array($field, self::SPARSE_COLUMNS, true)) {
+                $columns[] = $field;
+            } elseif (isset(self::SPARSE_APPENDS[$field])) {
+                $columns = array_merge($columns, self::SPARSE_APPENDS[$field]);
+            }
+        }
+
+        $query->select(array_map(fn ($column) => "products.{$column}", array_unique($columns)));
+        $query->with(array_values(array_filter(
+            $relations,
+            fn ($relation) => in_array(Str::before($relation, '.'), $fields, true)
+        )));
+
+        return array_values(array_unique(array_merge(['id'], $fields)));
+    }
+
+    /**
+     * Serialize only the requested fields of each product in a listing.
+     */
+    protected function restrictToSparseFields(Collection $products, ?array $fields): void
+    {
+        if ($fields === null) {
+            return;
+        }
+
+        $appends = array_values(array_intersect($fields, array_keys(self::SPARSE_APPENDS)));
+
+        $products->each(function (Product $product) use ($fields, $appends) {
+            $product->setAppends($appends)->setVisible($fields);
+        });
+    }
+
     /**
      * Display a single product (Public).
      */
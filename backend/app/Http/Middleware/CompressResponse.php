@@ -0,0 +1,88 @@
+<?php
+
+namespace App\Http\Middleware;
+
+use Closure;
+use Illuminate\Http\Request;
+use Symfony\Component\HttpFoundation\AcceptHeader;
+use Symfony\Component\HttpFoundation\BinaryFileResponse;
+use Symfony\Component\HttpFoundation\Response;
+use Symfony\Component\HttpFoundation\StreamedResponse;
+
+class CompressResponse
+{
+    /**
+     * Responses smaller than this are not worth compressing.
+     */
+    protected const MIN_LENGTH = 1024;
+
+    /**
+     * Compress the response body with brotli or gzip when the client accepts it.
+     *
+     * @param  \Closure(\Illuminate\Http\Request): (\Symfony\Component\HttpFoundation\Response)  $next
+     */
+    public function handle(Request $request, Closure $next): Response
+    {
+        $response = $next($request);
+
+        if ($response instanceof StreamedResponse
+            || $response instanceof BinaryFileResponse
+            || $response->headers->has('Content-Encoding')) {
+            return $response;
+        }
+
+        $content = $response->getContent();
+
+        if ($content === false || strlen($content) < self::MIN_LENGTH) {
+            return $response;
+        }
+
+        // Caches must key on the encoding even when we send the body as-is
+        $response->setVary('Accept-Encoding', false);
+
+        $encoding = $this->negotiateEncoding($request);
+
+        if ($encoding === null) {
+            return $response;
+        }
+
+        $compressed = $encoding === 'br'
+            ? brotli_compress($content)
+            : gzencode($content, 6);
+
+        if ($compressed === false) {
+            return $response;
+        }
+
+        $response->setContent($compressed);
+        $response->headers->set('Content-Encoding', $encoding);
+        $response->headers->set('Content-Length', (string) strlen($compressed));
+
+        return $response;
+    }
+
+    /**
+     * Pick the best encoding supported by both the client and this server.
+     */
+    protected function negotiateEncoding(Request $request): ?string
+    {
+        $accept = AcceptHeader::fromString($request->headers->get('Accept-Encoding'));
+
+        $accepts = function (string $encoding) use ($accept): bool {
+            $item = $accept->get($encoding);
+
+            return $item !== null && $item->getQuality() > 0;
+        };
+
+        // Brotli is only available when the PHP brotli extension is installed
+        if (function_exists('brotli_compress') && $accepts('br')) {
+            return 'br';
+        }
+
+        if (function_exists('gzencode') && $accepts('gzip')) {
+            return 'gzip';
+        }
+
+        return null;
+    }
+}
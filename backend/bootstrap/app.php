@@ -21,6 +21,11 @@
 
         // Add security headers to all responses
         $middleware->append(\App\Http\Middleware\SecurityHeaders::class);
+
+        // gzip/brotli compression for large JSON payloads (e.g. catalog listings)
+        $middleware->alias([
+            'compress' => \App\Http\Middleware\CompressResponse::class,
+        ]);
     })
     ->withExceptions(function (Exceptions $exceptions) {
         //
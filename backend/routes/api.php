@@ -34,7 +34,8 @@
         Route::get('/dashboard/order-status-chart', [\App\Http\Controllers\Api\DashboardController::class, 'orderStatusChart']);
         Route::get('/dashboard/product-category-chart', [\App\Http\Controllers\Api\DashboardController::class, 'productCategoryChart']);
 
-        Route::apiResource('products', \App\Http\Controllers\Api\ProductController::class);
+        Route::get('/products', [\App\Http\Controllers\Api\ProductController::class, 'index'])->name('products.index')->middleware('compress');
+        Route::apiResource('products', \App\Http\Controllers\Api\ProductController::class)->except(['index']);
 
         // Product bulk actions
         Route::post('/products/bulk-action', [\App\Http\Controllers\Api\ProductController::class, 'bulkAction']);
@@ -151,7 +152,7 @@
 Route::prefix('public')->group(function () {
     // Read operations - higher rate limit
     Route::middleware('throttle:60,1')->group(function () {
-        Route::get('/products', [\App\Http\Controllers\Api\ProductController::class, 'publicIndex']);
+        Route::get('/products', [\App\Http\Controllers\Api\ProductController::class, 'publicIndex'])->middleware('compress');
         Route::get('/products/{slug}', [\App\Http\Controllers\Api\ProductController::class, 'publicShow']);
         Route::get('/products/{productId}/reviews', [\App\Http\Controllers\Api\ProductReviewController::class, 'index']);
         Route::get('/products/{productId}/questions', [\App\Http\Controllers\Api\ProductQuestionController::class, 'index']);
@@ -165,4 +165,66 @@ public function test_featured_products_can_be_retrieved(): void
         $response->assertStatus(200);
         $this->assertCount(3, $response->json('data'));
     }
+
+    public function test_public_products_can_be_limited_to_sparse_fields(): void
+    {
+        Product::factory()->count(3)->create(['active' => true]);
+
+        $response = $this->getJson('/api/public/products?fields=slug,sku,is_in_stock,unknown');
+
+        $response->assertStatus(200);
+
+        foreach ($response->json('data') as $product) {
+            $this->assertEqualsCanonicalizing(['id', 'slug', 'sku', 'is_in_stock'], array_keys($product));
+        }
+    }
+
+    public function test_public_products_sparse_fields_accept_snake_case_relations(): void
+    {
+        Product::factory()->count(2)->create(['active' => true]);
+
+        $response = $this->getJson('/api/public/products?fields=slug,primary_image');
+
+        $response->assertStatus(200);
+
+        foreach ($response->json('data') as $product) {
+            $this->assertEqualsCanonicalizing(['id', 'slug', 'primary_image'], array_keys($product));
+        }
+    }
+
+    public function test_non_string_sparse_fields_are_ignored(): void
+    {
+        Product::factory()->create(['active' => true]);
+
+        $response = $this->getJson('/api/public/products?fields[]=id');
+
+        $response->assertStatus(200)
+            ->assertJsonStructure(['data' => ['*' => ['id', 'name', 'slug', 'price']]]);
+    }
+
+    public function test_admin_products_can_be_limited_to_sparse_fields(): void
+    {
+        Product::factory()->count(2)->create();
+
+        $response = $this->actingAs($this->admin)
+            ->getJson('/api/admin/products?fields=id,slug,categories');
+
+        $response->assertStatus(200);
+
+        foreach ($response->json('data') as $product) {
+            $this->assertEqualsCanonicalizing(['id', 'slug', 'categories'], array_keys($product));
+        }
+    }
+
+    public function test_product_listing_is_gzipped_when_accepted(): void
+    {
+        Product::factory()->count(12)->create(['active' => true]);
+
+        $response = $this->get('/api/public/products', ['Accept-Encoding' => 'gzip']);
+
+        $response->assertStatus(200)
+            ->assertHeader('Content-Encoding', 'gzip');
+
+        $this->assertCount(12, json_decode(gzdecode($response->getContent()), true)['data']);
+    }
 }